@@ -3,8 +3,10 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
 import logging
-from copy import deepcopy
+import os
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional, Union
 
 from huggingface_hub.constants import HUGGINGFACE_HUB_CACHE
@@ -18,6 +20,27 @@ from olive.passes.pass_config import BasePassConfig, PassConfigParam, get_user_s
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _optimum_symbols() -> SimpleNamespace:
+    """Import the optimum-intel export symbols once and cache them for subsequent pass runs."""
+    try:
+        from optimum.exporters.openvino import main_export
+        from optimum.exporters.openvino.utils import save_preprocessors
+        from optimum.intel.openvino.configuration import _DEFAULT_4BIT_CONFIG, OVConfig, get_default_int4_config
+        from optimum.intel.utils.modeling_utils import _infer_library_from_model_name_or_path
+    except ImportError as e:
+        raise ImportError("Please install Intel® optimum[openvino] to use OpenVINO Optimum Conversion") from e
+
+    return SimpleNamespace(
+        main_export=main_export,
+        save_preprocessors=save_preprocessors,
+        DEFAULT_4BIT_CONFIG=_DEFAULT_4BIT_CONFIG,
+        OVConfig=OVConfig,
+        get_default_int4_config=get_default_int4_config,
+        infer_library_from_model_name_or_path=_infer_library_from_model_name_or_path,
+    )
+
+
 def maybe_load_preprocessors(
     src_name_or_path: Union[str, Path], subfolder: str = "", trust_remote_code: bool = False
 ) -> list:
@@ -106,6 +129,70 @@ def infer_task(
     return task
 
 
+# diffusers pipeline class name -> optimum-intel OpenVINO pipeline class name
+_DIFFUSERS_OV_PIPELINE_CLS = {
+    "LatentConsistencyModelPipeline": "OVLatentConsistencyModelPipeline",
+    "StableDiffusionXLPipeline": "OVStableDiffusionXLPipeline",
+    "StableDiffusionPipeline": "OVStableDiffusionPipeline",
+    "StableDiffusion3Pipeline": "OVStableDiffusion3Pipeline",
+    "FluxPipeline": "OVFluxPipeline",
+    "SanaPipeline": "OVSanaPipeline",
+}
+
+
+@lru_cache
+def _get_optimum_intel_cls(cls_name: str):
+    """Import an OpenVINO model or pipeline class from optimum.intel once and cache it."""
+    import optimum.intel
+
+    return getattr(optimum.intel, cls_name)
+
+
+def _resolve_ov_pipeline_cls(class_name: str):
+    """Get the optimum-intel OpenVINO pipeline class for a diffusers pipeline class name."""
+    ov_cls_name = _DIFFUSERS_OV_PIPELINE_CLS.get(class_name)
+    if ov_cls_name is None:
+        raise NotImplementedError(f"Quantization isn't supported for class {class_name}.")
+    return _get_optimum_intel_cls(ov_cls_name)
+
+
+def _get_ov_model_cls_name(task: str) -> Optional[str]:
+    """Get the optimum-intel OpenVINO model class name that has to be instantiated to quantize a task.
+
+    Returns None if the task can be exported and quantized directly with main_export.
+    """
+    if task.startswith("text-generation"):
+        return "OVModelForCausalLM"
+    if task == "image-text-to-text":
+        return "OVModelForVisualCausalLM"
+    if "automatic-speech-recognition" in task:
+        return "OVModelForSpeechSeq2Seq"
+    return None
+
+
+@lru_cache(maxsize=32)
+def _cached_infer_library(model_name_or_path: str) -> str:
+    """Infer the library of a model, caching the result per model name or path."""
+    return _optimum_symbols().infer_library_from_model_name_or_path(model_name_or_path)
+
+
+@lru_cache(maxsize=32)
+def _cached_infer_task(task: str, model_name_or_path: str, library_name: Optional[str] = None) -> str:
+    """Infer the task of a model, caching the result to avoid repeated hub or disk lookups."""
+    return infer_task(task, model_name_or_path, library_name=library_name)
+
+
+@lru_cache(maxsize=16)
+def _cached_diffusers_config(model_name_or_path: str) -> dict:
+    """Load the diffusers pipeline config (model_index.json), caching the result per model name or path."""
+    try:
+        from diffusers import DiffusionPipeline
+    except ImportError:
+        raise ImportError("Please install diffusers to use OpenVINO with Diffusers models.") from None
+
+    return DiffusionPipeline.load_config(model_name_or_path)
+
+
 def maybe_convert_tokenizers(library_name: str, output: Path, model=None, preprocessors=None, task=None):
     from optimum.exporters.openvino.convert import export_tokenizer
 
@@ -176,6 +263,23 @@ class OVWeightFormat(StrEnumBase):
     NF4 = "nf4"
 
 
+_FLOAT_WEIGHT_FORMATS = frozenset((OVWeightFormat.FP16.value, OVWeightFormat.FP32.value))
+_MIXED_PRECISION_QUANT_MODES = frozenset(
+    (
+        OVQuantMode.NF4_F8E4M3.value,
+        OVQuantMode.NF4_F8E5M2.value,
+        OVQuantMode.INT4_F8E4M3.value,
+        OVQuantMode.INT4_F8E5M2.value,
+    )
+)
+
+
+@lru_cache
+def _enum_values(enum_cls) -> frozenset:
+    """Get the values of an enum as a frozenset, cached per enum class for option validation."""
+    return frozenset(member.value for member in enum_cls)
+
+
 class OpenVINOOptimumConversion(Pass):
     """Convert a Hugging Face PyTorch model to OpenVINO model using the Optimum export function."""
 
@@ -228,87 +332,38 @@ class OpenVINOOptimumConversion(Pass):
         if not super().validate_config(config, accelerator_spec):
             return False
 
-        # validate allowed libraries in extra_args if provided
-        if (
-            config.extra_args
-            and config.extra_args.get("library") is not None
-            and config.extra_args.get("library") not in [lib.value for lib in OVOptimumLibrary]
-        ):
-            logger.error(
-                "Library %s is not supported. Supported libraries are %s.",
-                config.extra_args.get("library"),
-                ", ".join([lib.value for lib in OVOptimumLibrary]),
-            )
-            return False
-
-        # validate allowed frameworks if provided
-        if (
-            config.extra_args
-            and config.extra_args.get("framework") is not None
-            and config.extra_args.get("framework") not in [framework.value for framework in OVOptimumFramework]
-        ):
-            logger.error(
-                "Framework %s is not supported. Supported frameworks are %s.",
-                config.extra_args.get("framework"),
-                ", ".join([framework.value for framework in OVOptimumFramework]),
-            )
-            return False
-
-        # validate quantization weight_format if provided
-        if (
-            config.ov_quant_config
-            and config.ov_quant_config.get("weight_format") is not None
-            and config.ov_quant_config.get("weight_format")
-            not in [weight_format.value for weight_format in OVWeightFormat]
-        ):
-            logger.error(
-                "Weight format %s is not supported. Supported weight formats are %s.",
-                config.ov_quant_config.get("weight_format"),
-                ", ".join([weight_format.value for weight_format in OVWeightFormat]),
-            )
-            return False
-
-        # validate quantization quant_mode if provided
-        if (
-            config.ov_quant_config
-            and config.ov_quant_config.get("quant_mode") is not None
-            and config.ov_quant_config.get("quant_mode") not in [quant_mode.value for quant_mode in OVQuantMode]
-        ):
-            logger.error(
-                "Quant mode %s is not supported. Supported quant modes are %s.",
-                config.ov_quant_config.get("quant_mode"),
-                ", ".join([quant_mode.value for quant_mode in OVQuantMode]),
-            )
-            return False
-
-        # validate backup precisions if provided
-        if (
-            config.ov_quant_config
-            and config.ov_quant_config.get("backup_precision") is not None
-            and config.ov_quant_config.get("backup_precision")
-            not in [backupmode.value for backupmode in nncf.BackupMode]
-        ):
-            logger.error(
-                "Backup precision %s is not supported. Supported backup precisions are %s.",
-                config.ov_quant_config.get("backup_precision"),
-                ", ".join([backupmode.value for backupmode in nncf.BackupMode]),
-            )
-            return False
+        # (config dict, key, enum of allowed values, name, plural name) for each option that is validated if provided
+        checks = (
+            (config.extra_args, "library", OVOptimumLibrary, "Library", "libraries"),
+            (config.extra_args, "framework", OVOptimumFramework, "Framework", "frameworks"),
+            (config.ov_quant_config, "weight_format", OVWeightFormat, "Weight format", "weight formats"),
+            (config.ov_quant_config, "quant_mode", OVQuantMode, "Quant mode", "quant modes"),
+            (config.ov_quant_config, "backup_precision", nncf.BackupMode, "Backup precision", "backup precisions"),
+        )
+        for cfg, key, allowed_enum, name, plural_name in checks:
+            if not cfg:
+                continue
+            value = cfg.get(key)
+            if value is not None and value not in _enum_values(allowed_enum):
+                logger.error(
+                    "%s %s is not supported. Supported %s are %s.",
+                    name,
+                    value,
+                    plural_name,
+                    ", ".join(member.value for member in allowed_enum),
+                )
+                return False
 
         return True
 
     def _run_for_config(
         self, model: HfModelHandler, config: type[BasePassConfig], output_model_path: str
     ) -> Union[OpenVINOModelHandler, CompositeModelHandler]:
-        try:
-            from optimum.exporters.openvino import main_export as export_optimum_intel
-            from optimum.exporters.openvino.utils import save_preprocessors
-            from optimum.intel.openvino.configuration import _DEFAULT_4BIT_CONFIG, OVConfig, get_default_int4_config
-            from optimum.intel.utils.modeling_utils import _infer_library_from_model_name_or_path
-        except ImportError as e:
-            raise ImportError("Please install Intel® optimum[openvino] to use OpenVINO Optimum Conversion") from e
-
-        extra_args = deepcopy(config.extra_args) if config.extra_args else {}
+        sym = _optimum_symbols()
+
+        # copy the top-level keys and one level of nested dicts; only top-level keys are mutated below,
+        # so the config's extra_args is never modified
+        extra_args = {k: (dict(v) if isinstance(v, dict) else v) for k, v in (config.extra_args or {}).items()}
         extra_args.update(
             {
                 "device": config.device,
@@ -319,7 +374,7 @@ class OpenVINOOptimumConversion(Pass):
             extra_args["trust_remote_code"] = model.load_kwargs.trust_remote_code
 
         if extra_args.get("library") is None:
-            lib_name = _infer_library_from_model_name_or_path(model.model_name_or_path)
+            lib_name = _cached_infer_library(model.model_name_or_path)
             if lib_name == "sentence_transformers":
                 logger.warning(
                     "Library is not specified. "
@@ -332,110 +387,74 @@ class OpenVINOOptimumConversion(Pass):
         else:
             lib_name = extra_args["library"]
 
-        if config.ov_quant_config:
-            if config.ov_quant_config.get("weight_format") is None and config.ov_quant_config.get("quant_mode") is None:
-                ov_config = None
-                if not no_compression_parameter_provided(config.ov_quant_config):
+        ov_config = None
+        qc = config.ov_quant_config
+        if qc:
+            weight_format = qc.get("weight_format")
+            quant_mode = qc.get("quant_mode")
+            dataset = qc.get("dataset")
+            if weight_format is None and quant_mode is None:
+                if not no_compression_parameter_provided(qc):
                     raise ValueError(
                         "Some compression parameters are provided, but the weight format is not specified. "
                         "Please provide it with weight_format key in ov_quant_config dictionary."
                     )
-                if not no_quantization_parameter_provided(config.ov_quant_config):
+                if not no_quantization_parameter_provided(qc):
                     raise ValueError(
                         "Some quantization parameters are provided, but the quant mode is not specified. "
                         "Please provide it with quant_mode key in ov_quant_config dictionary."
                     )
-            elif config.ov_quant_config.get("weight_format") in {"fp16", "fp32"}:
-                ov_config = OVConfig(dtype=config.ov_quant_config["weight_format"])
+            elif weight_format in _FLOAT_WEIGHT_FORMATS:
+                ov_config = sym.OVConfig(dtype=weight_format)
+            elif weight_format is not None:
+                # For int4 quantization if no parameter is provided, then use the default config if exists
+                if weight_format == "int4" and no_compression_parameter_provided(qc):
+                    quant_config = sym.get_default_int4_config(model.model_name_or_path)
+                else:
+                    quant_config = prep_wc_config(qc, sym.DEFAULT_4BIT_CONFIG)
+                if quant_config.get("dataset", None) is not None:
+                    quant_config["trust_remote_code"] = qc.get("trust_remote_code", False)
+                ov_config = sym.OVConfig(quantization_config=quant_config)
             else:
-                if config.ov_quant_config.get("weight_format") is not None:
-                    # For int4 quantization if no parameter is provided, then use the default config if exists
-                    if (
-                        no_compression_parameter_provided(config.ov_quant_config)
-                        and config.ov_quant_config.get("weight_format") == "int4"
-                    ):
-                        quant_config = get_default_int4_config(model.model_name_or_path)
-                    else:
-                        quant_config = prep_wc_config(config.ov_quant_config, _DEFAULT_4BIT_CONFIG)
-                    if quant_config.get("dataset", None) is not None:
-                        quant_config["trust_remote_code"] = config.ov_quant_config.get("trust_remote_code", False)
-                    ov_config = OVConfig(quantization_config=quant_config)
+                if dataset is None:
+                    raise ValueError(
+                        "Dataset is required for full quantization. "
+                        "Please provide it in ov_quant_config dictionary under 'dataset' key"
+                    )
+                if quant_mode in _MIXED_PRECISION_QUANT_MODES:
+                    if lib_name == "diffusers":
+                        raise NotImplementedError("Mixed precision quantization isn't supported for diffusers.")
+                    wc_config = prep_wc_config(qc, sym.DEFAULT_4BIT_CONFIG)
+                    wc_dtype, q_dtype = quant_mode.split("_")
+                    wc_config["dtype"] = wc_dtype
+
+                    q_config = prep_q_config(qc)
+                    q_config["dtype"] = q_dtype
+                    quant_config = {
+                        "weight_quantization_config": wc_config,
+                        "full_quantization_config": q_config,
+                        "num_samples": qc.get("num_samples"),
+                        "dataset": dataset,
+                        "trust_remote_code": qc.get("trust_remote_code", False),
+                    }
                 else:
-                    ov_config = None
-                    if config.ov_quant_config.get("dataset", None) is None:
-                        raise ValueError(
-                            "Dataset is required for full quantization. "
-                            "Please provide it in ov_quant_config dictionary under 'dataset' key"
-                        )
-                    if config.ov_quant_config.get("quant_mode") in [
-                        "nf4_f8e4m3",
-                        "nf4_f8e5m2",
-                        "int4_f8e4m3",
-                        "int4_f8e5m2",
-                    ]:
-                        if lib_name == "diffusers":
-                            raise NotImplementedError("Mixed precision quantization isn't supported for diffusers.")
-                        wc_config = prep_wc_config(config.ov_quant_config, _DEFAULT_4BIT_CONFIG)
-                        wc_dtype, q_dtype = config.ov_quant_config["quant_mode"].split("_")
-                        wc_config["dtype"] = wc_dtype
-
-                        q_config = prep_q_config(config.ov_quant_config)
-                        q_config["dtype"] = q_dtype
-                        quant_config = {
-                            "weight_quantization_config": wc_config,
-                            "full_quantization_config": q_config,
-                            "num_samples": self.args.num_samples,
-                            "dataset": self.args.dataset,
-                            "trust_remote_code": self.args.trust_remote_code,
-                        }
-                    else:
-                        quant_config = prep_q_config(config.ov_quant_config)
-                    ov_config = OVConfig(quantization_config=quant_config)
-        else:
-            ov_config = None
+                    quant_config = prep_q_config(qc)
+                ov_config = sym.OVConfig(quantization_config=quant_config)
 
         # quantization config
         quant_config = ov_config.quantization_config if ov_config else None
         quantize_with_dataset = quant_config and getattr(quant_config, "dataset", None) is not None
-        task = infer_task(extra_args.get("task", "auto"), model.model_name_or_path, library_name=lib_name)
+        task = _cached_infer_task(extra_args.get("task", "auto"), model.model_name_or_path, lib_name)
+        ov_model_cls_name = _get_ov_model_cls_name(task)
+        # visual language models are quantized through the model class even without a dataset
+        needs_model_cls = (
+            quant_config is not None if ov_model_cls_name == "OVModelForVisualCausalLM" else quantize_with_dataset
+        )
 
         # model
         if lib_name == "diffusers" and quantize_with_dataset:
-            try:
-                from diffusers import DiffusionPipeline
-            except ImportError:
-                raise ImportError("Please install diffusers to use OpenVINO with Diffusers models.") from None
-
-            diffusers_config = DiffusionPipeline.load_config(model.model_name_or_path)
-            class_name = diffusers_config.get("_class_name", None)
-
-            if class_name == "LatentConsistencyModelPipeline":
-                from optimum.intel import OVLatentConsistencyModelPipeline
-
-                model_cls = OVLatentConsistencyModelPipeline
-
-            elif class_name == "StableDiffusionXLPipeline":
-                from optimum.intel import OVStableDiffusionXLPipeline
-
-                model_cls = OVStableDiffusionXLPipeline
-            elif class_name == "StableDiffusionPipeline":
-                from optimum.intel import OVStableDiffusionPipeline
-
-                model_cls = OVStableDiffusionPipeline
-            elif class_name == "StableDiffusion3Pipeline":
-                from optimum.intel import OVStableDiffusion3Pipeline
-
-                model_cls = OVStableDiffusion3Pipeline
-            elif class_name == "FluxPipeline":
-                from optimum.intel import OVFluxPipeline
-
-                model_cls = OVFluxPipeline
-            elif class_name == "SanaPipeline":
-                from optimum.intel import OVSanaPipeline
-
-                model_cls = OVSanaPipeline
-            else:
-                raise NotImplementedError(f"Quantization isn't supported for class {class_name}.")
+            diffusers_config = _cached_diffusers_config(model.model_name_or_path)
+            model_cls = _resolve_ov_pipeline_cls(diffusers_config.get("_class_name", None))
 
             output_model = model_cls.from_pretrained(
                 model.model_name_or_path, export=True, quantization_config=quant_config
@@ -443,21 +462,8 @@ class OpenVINOOptimumConversion(Pass):
             output_model.save_pretrained(output_model_path)
             if not extra_args.get("disable_convert_tokenizer", False):
                 maybe_convert_tokenizers(lib_name, output_model_path, model, task=task)
-        elif (
-            quantize_with_dataset and (task.startswith("text-generation") or "automatic-speech-recognition" in task)
-        ) or (task == "image-text-to-text" and quant_config is not None):
-            if task.startswith("text-generation"):
-                from optimum.intel import OVModelForCausalLM
-
-                model_cls = OVModelForCausalLM
-            elif task == "image-text-to-text":
-                from optimum.intel import OVModelForVisualCausalLM
-
-                model_cls = OVModelForVisualCausalLM
-            else:
-                from optimum.intel import OVModelForSpeechSeq2Seq
-
-                model_cls = OVModelForSpeechSeq2Seq
+        elif ov_model_cls_name is not None and needs_model_cls:
+            model_cls = _get_optimum_intel_cls(ov_model_cls_name)
 
             # In this case, to apply quantization an instance of a model class is required
             output_model = model_cls.from_pretrained(
@@ -474,7 +480,7 @@ class OpenVINOOptimumConversion(Pass):
             preprocessors = maybe_load_preprocessors(
                 model.model_name_or_path, trust_remote_code=extra_args.get("trust_remote_code", False)
             )
-            save_preprocessors(
+            sym.save_preprocessors(
                 preprocessors, output_model.config, output_model_path, extra_args.get("trust_remote_code", False)
             )
             if not extra_args.get("disable_convert_tokenizer", False):
@@ -482,20 +488,19 @@ class OpenVINOOptimumConversion(Pass):
 
         else:
             extra_args["ov_config"] = ov_config
-            extra_args["stateful"] = not extra_args.get("disable_stateful", False)
-            extra_args.pop("disable_stateful", False)
-            extra_args["convert_tokenizer"] = not extra_args.get("disable_convert_tokenizer", False)
-            extra_args.pop("disable_convert_tokenizer", False)
-            extra_args["library_name"] = lib_name
+            extra_args["stateful"] = not extra_args.pop("disable_stateful", False)
+            extra_args["convert_tokenizer"] = not extra_args.pop("disable_convert_tokenizer", False)
             extra_args.pop("library", None)
-            export_optimum_intel(
+            extra_args["library_name"] = lib_name
+            sym.main_export(
                 model.model_name_or_path,
                 output_model_path,
                 **extra_args,
             )
 
         # check the exported components
-        exported_models = [name.stem for name in Path(output_model_path).iterdir() if name.suffix == ".xml"]
+        with os.scandir(output_model_path) as entries:
+            exported_models = [entry.name[:-4] for entry in entries if entry.name.endswith(".xml")]
         logger.debug("Exported models are: %s.", exported_models)
 
         # OpenVINOModelHandler requires a directory with a single xml and bin file
@@ -508,21 +513,22 @@ class OpenVINOOptimumConversion(Pass):
 
         # do not include tokenizer and detokenizer models for composite model creation
         remove_list = ["openvino_tokenizer", "openvino_detokenizer"]
-        components = deepcopy(exported_models)
+        components = list(exported_models)
+        output_dir = Path(output_model_path)
         if len(exported_models) > 1:
             for exported_model in exported_models:
                 # move all extra OpenVINO XML and bin files to their respective subfolders
                 if exported_model != "openvino_model":
-                    extra_model_xml = Path(output_model_path) / f"{exported_model}.xml"
-                    extra_model_bin = Path(output_model_path) / f"{exported_model}.bin"
-                    dest_subdir = Path(output_model_path) / exported_model
+                    extra_model_xml = output_dir / f"{exported_model}.xml"
+                    extra_model_bin = output_dir / f"{exported_model}.bin"
+                    dest_subdir = output_dir / exported_model
                     dest_subdir.mkdir(parents=True, exist_ok=True)
                     if extra_model_xml.exists():
-                        dest_xml = Path(dest_subdir) / f"{exported_model}.xml"
+                        dest_xml = dest_subdir / f"{exported_model}.xml"
                         extra_model_xml.rename(dest_xml)
                         logger.debug("Moved %s to %s.", extra_model_xml, dest_xml)
                     if extra_model_bin.exists():
-                        dest_bin = Path(dest_subdir) / f"{exported_model}.bin"
+                        dest_bin = dest_subdir / f"{exported_model}.bin"
                         extra_model_bin.rename(dest_bin)
                         logger.debug("Moved %s to %s.", extra_model_bin, dest_bin)
                 if exported_model in remove_list:
@@ -535,84 +541,84 @@ class OpenVINOOptimumConversion(Pass):
             return OpenVINOModelHandler(model_path=output_model_path)
 
         # if there are multiple components, return a composite model
-        model_components = []
-        model_component_names = []
-        for component_name in components:
-            if component_name in remove_list:
-                # skip tokenizer and detokenizer models from the composite model
-                continue
-            if component_name != "openvino_model":
-                # Each component is in a separate subfolder
-                model_components.append(OpenVINOModelHandler(model_path=Path(output_model_path) / component_name))
-            else:
-                # The main model is in the output_model_path
-                model_components.append(OpenVINOModelHandler(model_path=output_model_path))
-            model_component_names.append(component_name)
+        # tokenizer and detokenizer models were already dropped from components above
+        # the main model is in the output_model_path, each other component is in a separate subfolder
+        model_components = [
+            OpenVINOModelHandler(
+                model_path=output_model_path if component_name == "openvino_model" else output_dir / component_name
+            )
+            for component_name in components
+        ]
 
-        return CompositeModelHandler(model_components, model_component_names, model_path=output_model_path)
+        return CompositeModelHandler(model_components, components, model_path=output_model_path)
 
 
 def prep_wc_config(quant_cfg, default_cfg):
     """Prepare the weight compression config for OpenVINO."""
-    is_int8 = quant_cfg.get("weight_format") == "int8"
-    return {
-        "bits": 8 if is_int8 else 4,
-        "ratio": 1.0 if is_int8 else (quant_cfg.get("ratio") or default_cfg.get("ratio")),
-        "sym": quant_cfg.get("sym", False),
-        "group_size": -1 if is_int8 else quant_cfg.get("group_size"),
-        "all_layers": None if is_int8 else quant_cfg.get("all_layers", False),
-        "dataset": quant_cfg.get("dataset"),
-        "num_samples": quant_cfg.get("num_samples"),
-        "quant_method": "awq" if quant_cfg.get("awq", False) else "default",
-        "sensitivity_metric": quant_cfg.get("sensitivity_metric"),
-        "scale_estimation": quant_cfg.get("scale_estimation", None),
-        "gptq": quant_cfg.get("gptq", None),
-        "lora_correction": quant_cfg.get("lora_correction", None),
-        "dtype": quant_cfg.get("weight_format"),
-        "backup_precision": quant_cfg.get("backup_precision"),
+    get = quant_cfg.get
+    weight_format = get("weight_format")
+    config = {
+        "sym": get("sym", False),
+        "dataset": get("dataset"),
+        "num_samples": get("num_samples"),
+        "quant_method": "awq" if get("awq", False) else "default",
+        "sensitivity_metric": get("sensitivity_metric"),
+        "scale_estimation": get("scale_estimation", None),
+        "gptq": get("gptq", None),
+        "lora_correction": get("lora_correction", None),
+        "dtype": weight_format,
+        "backup_precision": get("backup_precision"),
     }
+    if weight_format == "int8":
+        config.update({"bits": 8, "ratio": 1.0, "group_size": -1, "all_layers": None})
+    else:
+        config.update(
+            {
+                "bits": 4,
+                "ratio": get("ratio") or default_cfg.get("ratio"),
+                "group_size": get("group_size"),
+                "all_layers": get("all_layers", False),
+            }
+        )
+    return config
 
 
 def prep_q_config(quant_cfg):
     """Prepare the quantization config for OpenVINO."""
+    get = quant_cfg.get
     return {
-        "dtype": quant_cfg.get("quant_mode"),
+        "dtype": get("quant_mode"),
         "bits": 8,
-        "sym": quant_cfg.get("sym", False),
-        "dataset": quant_cfg.get("dataset"),
-        "num_samples": quant_cfg.get("num_samples"),
-        "smooth_quant_alpha": quant_cfg.get("smooth_quant_alpha"),
-        "trust_remote_code": quant_cfg.get("trust_remote_code", False),
+        "sym": get("sym", False),
+        "dataset": get("dataset"),
+        "num_samples": get("num_samples"),
+        "smooth_quant_alpha": get("smooth_quant_alpha"),
+        "trust_remote_code": get("trust_remote_code", False),
     }
 
 
+_COMPRESSION_PARAMETER_KEYS = (
+    "ratio",
+    "group_size",
+    "sym",
+    "all_layers",
+    "dataset",
+    "num_samples",
+    "awq",
+    "scale_estimation",
+    "gptq",
+    "lora_correction",
+    "sensitivity_metric",
+    "backup_precision",
+)
+_QUANTIZATION_PARAMETER_KEYS = ("sym", "dataset", "num_samples", "smooth_quant_alpha")
+
+
 def no_compression_parameter_provided(q_config):
-    return all(
-        it is None
-        for it in (
-            q_config.get("ratio", None),
-            q_config.get("group_size", None),
-            q_config.get("sym", None),
-            q_config.get("all_layers", None),
-            q_config.get("dataset", None),
-            q_config.get("num_samples", None),
-            q_config.get("awq", None),
-            q_config.get("scale_estimation", None),
-            q_config.get("gptq", None),
-            q_config.get("lora_correction", None),
-            q_config.get("sensitivity_metric", None),
-            q_config.get("backup_precision", None),
-        )
-    )
+    get = q_config.get
+    return not any(get(key) is not None for key in _COMPRESSION_PARAMETER_KEYS)
 
 
 def no_quantization_parameter_provided(q_config):
-    return all(
-        it is None
-        for it in (
-            q_config.get("sym", None),
-            q_config.get("dataset", None),
-            q_config.get("num_samples", None),
-            q_config.get("smooth_quant_alpha", None),
-        )
-    )
+    get = q_config.get
+    return not any(get(key) is not None for key in _QUANTIZATION_PARAMETER_KEYS)
@@ -3,6 +3,8 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from olive.passes.olive_pass import create_pass_from_dict
 from olive.passes.openvino.optimum_intel import OpenVINOOptimumConversion
@@ -151,3 +153,48 @@ def test_openvino_optimum_conversion_pass_convert_multiple_components_without_ma
         assert xml_file.is_file()
         assert bin_file.exists()
         assert bin_file.is_file()
+
+
+@patch("olive.passes.openvino.optimum_intel._cached_infer_task", return_value="feature-extraction")
+@patch("olive.passes.openvino.optimum_intel._optimum_symbols")
+def test_openvino_optimum_conversion_pass_mixed_precision_quant_config(mock_optimum_symbols, _, tmp_path):
+    # setup
+    def fake_main_export(model_name_or_path, output, **kwargs):
+        Path(output).mkdir(parents=True, exist_ok=True)
+        (Path(output) / "openvino_model.xml").touch()
+        (Path(output) / "openvino_model.bin").touch()
+
+    mock_ov_config = MagicMock()
+    mock_main_export = MagicMock(side_effect=fake_main_export)
+    mock_optimum_symbols.return_value = SimpleNamespace(
+        OVConfig=mock_ov_config, main_export=mock_main_export, DEFAULT_4BIT_CONFIG={"ratio": 1.0}
+    )
+
+    input_hf_model = get_hf_model()
+    openvino_optimum_conversion_config = {
+        "ov_quant_config": {
+            "quant_mode": "int4_f8e4m3",
+            "dataset": "wikitext2",
+            "num_samples": 8,
+            "trust_remote_code": True,
+        },
+        "extra_args": {"library": "transformers", "task": "feature-extraction"},
+    }
+
+    p = create_pass_from_dict(OpenVINOOptimumConversion, openvino_optimum_conversion_config, disable_search=True)
+
+    # create output folder
+    output_folder = str(Path(tmp_path) / "openvino_optimum_convert")
+
+    # execute
+    p.run(input_hf_model, output_folder)
+
+    # assert
+    mock_ov_config.assert_called_once()
+    quant_config = mock_ov_config.call_args.kwargs["quantization_config"]
+    assert quant_config["num_samples"] == 8
+    assert quant_config["dataset"] == "wikitext2"
+    assert quant_config["trust_remote_code"] is True
+    assert quant_config["weight_quantization_config"]["dtype"] == "int4"
+    assert quant_config["full_quantization_config"]["dtype"] == "f8e4m3"
+    assert mock_main_export.call_args.kwargs["ov_config"] is mock_ov_config.return_value